@@ -1,13 +1,27 @@
 import argparse
+import hashlib
+import logging
 import os
+import pickle
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple
 
-from alembic.config import Config
-from alembic.script import ScriptDirectory
-from alembic.script.revision import RangeNotAncestorError, ResolutionError
-from sqlalchemy import MetaData, create_engine
-from sqlalchemy.sql import select
+logger = logging.getLogger(__name__)
+
+
+class AlembicCheckError(Exception):
+    """Raised when a migration alignment check fails or cannot be performed."""
+
+
+# Matches the `revision = "..."` / `down_revision = "..."` (or None)
+# assignments that Alembic writes into every migration script.
+_REVISION_RE = re.compile(r"^revision\s*(?::[^=]*)?=\s*['\"](\w+)['\"]", re.M)
+_DOWN_REVISION_RE = re.compile(
+    r"^down_revision\s*(?::[^=]*)?=\s*(?:['\"](\w+)['\"]|None)", re.M
+)
+
 
 SCRIPT_DESCRIPTION = """
 This script checks the Alembic version of the latest migration against the database and evaluates its readiness.
@@ -32,9 +46,24 @@ class AlembicMigrationChecker:
       to determine migration readiness and alignment.
       Returns:
         - 0 if the database is up-to-date with the latest migration script or if there are no new migrations detected.
-        - 1 if there's a version mismatch or other error.
+      Raises:
+        - AlembicCheckError if there's a version mismatch or other error.
+    - check_many(configs): Runs the alignment check for several databases
+      in one process, returning one exit code per config.
     """
 
+    # Alembic Config objects cached per (migrations_path, db_url), so many
+    # checkers in one process don't rebuild identical configs.
+    _config_cache = {}
+
+    # The version query is fixed, so build it once at class scope instead of
+    # per call.
+    _VERSION_QUERY = "SELECT version_num FROM alembic_version LIMIT 1"
+
+    # On-disk cache of the parsed revision graph, stored alongside the
+    # migration scripts and invalidated whenever versions/ changes.
+    _REVMAP_CACHE_NAME = ".alembic_revmap.pkl"
+
     def __init__(
         self,
         db_url,
@@ -59,7 +88,7 @@ class AlembicMigrationChecker:
         :param db_name: The database name
         :param migrations_path: The path to Alembic migrations folder
         """
-        print("Initializing AlembicMigrationChecker...")
+        logger.info("Initializing AlembicMigrationChecker...")
         self.db_type = db_type
         self.db_host = db_host
         self.db_port = db_port
@@ -67,6 +96,7 @@ class AlembicMigrationChecker:
         self.db_password = db_password
         self.db_name = db_name
         self.migrations_path = migrations_path
+        self._db_url = None
 
         if db_url:
             self.db_url = db_url
@@ -79,10 +109,12 @@ class AlembicMigrationChecker:
         self.engine = self._get_database_engine()
         self._alembic_cfg = None
         self._script_directory = None
+        self._revision_map = None
+        self._head_revision = None
 
     def _validate_db_inputs(self):
         """
-        Validates the necessary inputs for connecting to a database and accessing the migrations folder path.
+        Validates the necessary inputs for connecting to a database.
 
         Returns:
             str: An error message string if validation fails, indicating the reason for the failure.
@@ -90,7 +122,7 @@ class AlembicMigrationChecker:
 
         Raises:
             Exception: Catches and returns any exceptions as error messages that occur during the
-                validation of the migrations folder path.
+                validation of the database inputs.
 
         """
         try:
@@ -111,90 +143,248 @@ class AlembicMigrationChecker:
             ):
                 return "\nERROR: Database host, port, user, and password are required for non-SQLite databases."
 
-            # Check migrations path existence
-            if not os.path.exists(self.migrations_path):
-                print(self.migrations_path)
-                return (
-                    f"\nERROR: Migrations path '{self.migrations_path}' does not exist."
-                )
+            # Validate the port is numeric before it reaches URL.create
+            if self.db_type != "sqlite" and not str(self.db_port).isdigit():
+                return f"\nERROR: Invalid database port '{self.db_port}'. The port must be a number."
 
+            # The migrations path itself is validated by ScriptDirectory
+            # when the script directory is first accessed.
             return None
         except Exception as e:
             # Handle any exceptions that were raised during validation
             return f"\nERROR during input validation: {e}"
 
     def _get_database_url(self):
-        """Constructs and returns the database URL."""
-        if self.db_type == "sqlite":
-            return f"sqlite:///{self.db_name}"  # SQLite doesn't use port
-        return f"{self.db_type}://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
+        """Constructs, caches, and returns the database URL."""
+        if self._db_url is None:
+            # URL.create escapes special characters in credentials and lets
+            # create_engine skip re-parsing a DSN string.
+            from sqlalchemy.engine import URL
+
+            if self.db_type == "sqlite":
+                # SQLite doesn't use host, port, or credentials
+                self._db_url = URL.create("sqlite", database=self.db_name)
+            else:
+                self._db_url = URL.create(
+                    drivername=self.db_type,
+                    username=self.db_user,
+                    password=self.db_password,
+                    host=self.db_host,
+                    port=int(self.db_port) if self.db_port else None,
+                    database=self.db_name,
+                )
+        return self._db_url
 
     def _get_database_engine(self):
         """Creates and returns a SQLAlchemy database engine."""
-        print("Creating a SQLAlchemy database engine...")
+        logger.info("Creating a SQLAlchemy database engine...")
+        # Imported here so --help and validation errors skip the SQLAlchemy
+        # import cost.
+        from sqlalchemy import create_engine
+
         try:
-            engine = create_engine(self.db_url)
-            print("Database engine created successfully.")
-            engine.connect()
-            print("Database engine connected successfully.")
+            # pool_pre_ping validates connections on first checkout, so no
+            # eager connect() round-trip is needed just to test the URL.
+            engine = create_engine(self.db_url, pool_pre_ping=True)
+            logger.info("Database engine created successfully.")
             return engine
         except Exception as e:
-            print("\nERROR creating database engine:", e)
-            sys.exit(1)
+            raise AlembicCheckError(f"\nERROR creating database engine: {e}") from e
 
     @property
     def alembic_config(self):
         """Creates a custom Alembic Config object in memory for accessing migration information."""
         if not self._alembic_cfg:
-            self._alembic_cfg = Config()
-            self._alembic_cfg.set_main_option("script_location", self.migrations_path)
-            self._alembic_cfg.set_main_option("sqlalchemy.url", self.db_url)
+            key = (self.migrations_path, self.db_url)
+            cfg = type(self)._config_cache.get(key)
+            if cfg is None:
+                from alembic.config import Config
+
+                url = self.db_url
+                if not isinstance(url, str):
+                    url = url.render_as_string(hide_password=False)
+
+                cfg = Config()
+                cfg.set_main_option("script_location", self.migrations_path)
+                cfg.set_main_option("sqlalchemy.url", url)
+                type(self)._config_cache[key] = cfg
+            self._alembic_cfg = cfg
         return self._alembic_cfg
 
     @property
     def script_directory(self):
         """Accesses the Alembic script directory."""
         if not self._script_directory:
-            self._script_directory = ScriptDirectory.from_config(self.alembic_config)
+            from alembic.script import ScriptDirectory
+
+            try:
+                self._script_directory = ScriptDirectory.from_config(
+                    self.alembic_config
+                )
+            except Exception as e:
+                raise AlembicCheckError(
+                    f"\nERROR: Migrations path '{self.migrations_path}' is not a "
+                    f"valid Alembic script directory: {e}"
+                ) from e
+            # Cache the revision map so the versions/ directory is only
+            # walked once per process instead of on every traversal.
+            self._revision_map = self._script_directory.revision_map
+            self._store_cached_revision_map(self._script_directory)
         return self._script_directory
 
+    @property
+    def revision_map(self):
+        """Accesses the cached Alembic revision map."""
+        if self._revision_map is None:
+            self._revision_map = self._load_cached_revision_map()
+        if self._revision_map is None:
+            _ = self.script_directory
+        return self._revision_map
+
+    def _versions_fingerprint(self):
+        """Hashes the (name, mtime, size) of every script in versions/."""
+        versions_dir = os.path.join(self.migrations_path, "versions")
+        entries = []
+        try:
+            for entry in os.scandir(versions_dir):
+                if not entry.name.endswith(".py") or entry.name.startswith("__"):
+                    continue
+                stat = entry.stat()
+                entries.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            return None
+        digest = hashlib.sha256(repr(sorted(entries)).encode()).hexdigest()
+        return digest
+
+    def _load_cached_revision_map(self):
+        """Rebuilds the revision map from the on-disk cache if still valid.
+
+        Returns a RevisionMap of plain Revision nodes — enough for head
+        resolution and pending walks — or None on any miss or mismatch, in
+        which case the caller re-parses the scripts via ScriptDirectory.
+        """
+        fingerprint = self._versions_fingerprint()
+        if fingerprint is None:
+            return None
+        cache_path = os.path.join(self.migrations_path, self._REVMAP_CACHE_NAME)
+        try:
+            with open(cache_path, "rb") as f:
+                payload = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            return None
+        if not isinstance(payload, dict) or payload.get("fingerprint") != fingerprint:
+            return None
+
+        from alembic.script.revision import Revision, RevisionMap
+
+        revisions = [
+            Revision(revision, down_revision, dependencies=dependencies)
+            for revision, down_revision, dependencies in payload["revisions"]
+        ]
+        return RevisionMap(lambda: iter(revisions))
+
+    def _store_cached_revision_map(self, script_directory):
+        """Persists the parsed revision graph next to the migration scripts."""
+        fingerprint = self._versions_fingerprint()
+        if fingerprint is None:
+            return
+        payload = {
+            "fingerprint": fingerprint,
+            "revisions": [
+                (script.revision, script.down_revision, script.dependencies)
+                for script in script_directory.walk_revisions()
+            ],
+        }
+        cache_path = os.path.join(self.migrations_path, self._REVMAP_CACHE_NAME)
+        try:
+            with open(cache_path, "wb") as f:
+                pickle.dump(payload, f)
+        except OSError:
+            # Read-only checkouts simply skip the cache.
+            pass
+
+    @property
+    def head_revision(self):
+        """Resolves and caches the head revision of the migration graph."""
+        if self._head_revision is None:
+            self._head_revision = self.revision_map.get_revision("head")
+        return self._head_revision
+
+    def _scan_head_revision(self):
+        """Cheaply determines the head revision by scanning migration files.
+
+        Reads the revision/down_revision assignments out of each script in
+        versions/ with a regex instead of loading the scripts through
+        ScriptDirectory. Returns the head revision id, or None whenever the
+        scan is inconclusive (unparseable script, merge/branch layout, or
+        multiple heads) so the caller can fall back to full parsing.
+        """
+        versions_dir = os.path.join(self.migrations_path, "versions")
+        revisions = set()
+        down_revisions = set()
+        try:
+            for entry in os.scandir(versions_dir):
+                if not entry.name.endswith(".py") or entry.name.startswith("__"):
+                    continue
+                with open(entry.path, encoding="utf-8") as f:
+                    source = f.read()
+                revision_match = _REVISION_RE.search(source)
+                down_match = _DOWN_REVISION_RE.search(source)
+                if revision_match is None or down_match is None:
+                    return None
+                revisions.add(revision_match.group(1))
+                if down_match.group(1) is not None:
+                    down_revisions.add(down_match.group(1))
+        except (OSError, UnicodeDecodeError):
+            # Unreadable or non-UTF8 scripts (PEP 263 encodings) make the
+            # scan inconclusive; fall back to ScriptDirectory.
+            return None
+
+        heads = revisions - down_revisions
+        if len(heads) == 1:
+            return heads.pop()
+        return None
+
     def get_latest_migration_version(self):
         """Returns the latest migration version from the Alembic migrations directory."""
-        print(
+        logger.info(
             "Retrieving the latest migration version from the Alembic migrations directory..."
         )
-        head_revision = self.script_directory.get_revision("head")
+        head_revision = self.head_revision
         if head_revision is not None:
-            print("Latest migration version found.")
+            logger.info("Latest migration version found.")
             return head_revision.revision
 
-        print("\nERROR: No head revision found in Alembic migrations.")
+        logger.error("\nERROR: No head revision found in Alembic migrations.")
         return None
 
     def get_db_version(self):
         """Fetches and returns the current database version from the Alembic version table."""
-        print("Attempting to fetch the current database version...")
+        logger.info("Attempting to fetch the current database version...")
         try:
-            metadata = MetaData()
-            metadata.reflect(bind=self.engine)
-            alembic_version_table = metadata.tables["alembic_version"]
-            query = select(alembic_version_table.c.version_num).limit(1)
+            # The alembic_version table has a fixed, known structure, so a
+            # single raw query avoids the reflection round-trips entirely.
             with self.engine.connect() as connection:
-                result = connection.execute(query)
-                db_version = result.fetchone()[0]
-                print("Database version fetched successfully.")
-                return db_version
+                result = connection.exec_driver_sql(self._VERSION_QUERY)
+                row = result.fetchone()
+            if row is None:
+                logger.error("\nERROR: The alembic_version table is empty.")
+                return None
+            logger.info("Database version fetched successfully.")
+            return row[0]
         except Exception as e:
-            print("\nERROR fetching database version:", e)
-            sys.exit(1)
+            raise AlembicCheckError(f"\nERROR fetching database version: {e}") from e
 
     def find_pending_migrations(
         self,
-        latest_migration: str,
+        latest_migration,
         db_version: str,
     ) -> Tuple[bool, int]:
         """
         Checks if the database version is a revision of the latest migration.
+        `latest_migration` may be a revision id string or an already-resolved
+        Revision object; passing the resolved object skips re-resolving the
+        id through the revision map.
         Returns a tuple of two elements:
         - The first element is a boolean indicating whether the database version is a revision of the latest migration.
         - The second element is the number of pending migrations.
@@ -207,88 +397,154 @@ class AlembicMigrationChecker:
             Tuple[bool, int]: A tuple containing a boolean indicating whether the database version
             is a revision of the latest migration and the number of pending migrations.
         """
+        from alembic.script.revision import RangeNotAncestorError, ResolutionError
+
+        # iterate_revisions only takes revision id strings, so unwrap a
+        # resolved Revision to its exact id; this still avoids a second
+        # symbolic "head" resolution against the whole heads set.
+        latest_revision = getattr(latest_migration, "revision", latest_migration)
         try:
-            iterator = self.script_directory.iterate_revisions(
-                latest_migration,
+            iterator = self.revision_map.iterate_revisions(
+                latest_revision,
                 db_version,
             )
-            pending_migrations_count = [
-                revision.revision for revision in iterator if revision is not None
-            ]
-            return True, len(pending_migrations_count)
+            pending_migrations_count = sum(
+                1 for revision in iterator if revision is not None
+            )
+            return True, pending_migrations_count
         except (RangeNotAncestorError, ResolutionError) as ex:
-            print(f"Error: {ex}")
+            logger.error("Error: %s", ex)
             return False, 0
 
     def evaluate_migration_alignment(self):
         """Assesses the database against the latest migration script to
         determine migration readiness and alignment.
+
+        Returns:
+            int: 0 when the database is up-to-date or pending migrations
+            are cleanly aligned with the migration history.
+
+        Raises:
+            AlembicCheckError: If the versions cannot be determined or the
+                database version does not belong to the migration history.
         """
-        print("Starting migration alignement evaluation...")
-        latest_migration_version = self.get_latest_migration_version()
+        logger.info("Starting migration alignement evaluation...")
+        # The head lookup hits the migrations directory and the version
+        # fetch hits the database; they are independent, so overlap them.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            db_future = executor.submit(self.get_db_version)
+            scanned_head = self._scan_head_revision()
+            latest_future = None
+            if scanned_head is None:
+                # An inconclusive scan always needs the full parse, so
+                # overlap it with the database fetch.
+                latest_future = executor.submit(self.get_latest_migration_version)
+            db_version = db_future.result()
+        if scanned_head is not None and scanned_head == db_version:
+            # Common CI case: the database is already at head. The cheap
+            # filename scan settled it, so skip ScriptDirectory parsing.
+            latest_migration_version = scanned_head
+        elif latest_future is not None:
+            latest_migration_version = latest_future.result()
+        else:
+            latest_migration_version = self.get_latest_migration_version()
         if latest_migration_version is None:
-            print(
+            raise AlembicCheckError(
                 "\nERROR: No head revision found in Alembic migrations."
                 "Please check the migration script for issues."
             )
-            sys.exit(1)
-        db_version = self.get_db_version()
         if db_version is None:
-            print(
+            raise AlembicCheckError(
                 "\nERROR: No database version found."
                 "Please check the database for issues."
             )
-            sys.exit(1)
-        print(
-            f"\nLatest Alembic migration version (revision): {latest_migration_version}"
+        logger.info(
+            "\nLatest Alembic migration version (revision): %s",
+            latest_migration_version,
         )
-        print(f"Current database Alembic version: {db_version}")
+        logger.info("Current database Alembic version: %s", db_version)
 
         if latest_migration_version == db_version:
-            print(
+            logger.info(
                 "\nSUCCESS: The database version matches the latest migration script's revision ID. "
                 "\nNOTICE: No new migrations have been detected.\nIf a "
                 "new migration was expected but not recognized, "
                 "please check the migration script for issues."
             )
-            sys.exit(0)
+            return 0
         else:
-            print("Revision do not match, checking for pending migrations...")
+            logger.info("Revision do not match, checking for pending migrations...")
+            # The mismatch branch always ran the full head resolution, so
+            # hand the cached Revision object to the pending walk.
             found_revision, pending_migrations_count = self.find_pending_migrations(
-                latest_migration_version, db_version
+                self.head_revision, db_version
             )
             if found_revision:
                 if pending_migrations_count == 1:
-                    print(
-                        f"\nSUCCESS: The database is currently at version {db_version}, which aligns with the down "
-                        f"revision of the latest migration script, identified by version ({latest_migration_version})."
-                        f"This alignment indicates that one pending migration is ready to be applied to bring the "
-                        f"database schema up to the latest version."
+                    logger.info(
+                        "\nSUCCESS: The database is currently at version %s, which aligns with the down "
+                        "revision of the latest migration script, identified by version (%s)."
+                        "This alignment indicates that one pending migration is ready to be applied to bring the "
+                        "database schema up to the latest version.",
+                        db_version,
+                        latest_migration_version,
                     )
                 else:
-                    print(
-                        f"\nSUCCESS: The database is currently at version {db_version}, which corresponds to a "
-                        f"version from a previously applied migration.\nHowever, there are currently "
-                        f"{pending_migrations_count} new migration scripts ready to be applied to bring the database "
-                        f"schema up to the most recent version.\nRecommendation: Apply the {pending_migrations_count} "
-                        f"pending migrations in sequence, with thorough testing and backups for each. This strategy "
-                        f"ensures stability and simplifies rollback if needed."
+                    logger.info(
+                        "\nSUCCESS: The database is currently at version %s, which corresponds to a "
+                        "version from a previously applied migration.\nHowever, there are currently "
+                        "%s new migration scripts ready to be applied to bring the database "
+                        "schema up to the most recent version.\nRecommendation: Apply the %s "
+                        "pending migrations in sequence, with thorough testing and backups for each. This strategy "
+                        "ensures stability and simplifies rollback if needed.",
+                        db_version,
+                        pending_migrations_count,
+                        pending_migrations_count,
                     )
-                sys.exit(0)
+                return 0
             else:
-                print(
+                raise AlembicCheckError(
                     f"\nERROR: Version mismatch detected.\n"
                     f"The current database version ({db_version}) does not match the `down_revision` of any known "
                     f"migration script.\nImmediate Action Required: "
                     f"Review migration history and scripts for accuracy. "
                     f"Addressing discrepancies is vital for database integrity and smooth migration processes."
                 )
-                sys.exit(1)
+
+    @classmethod
+    def check_many(cls, configs):
+        """Runs the alignment check for several databases in one process.
+
+        Each config is a dict of the constructor's keyword arguments. The
+        imported alembic/sqlalchemy modules are reused across checks, so
+        multi-database setups avoid paying interpreter startup per database.
+
+        :param configs: A list of dicts of AlembicMigrationChecker kwargs
+        :return: A list of exit codes, one per config (0 success, 1 failure)
+        """
+        results = []
+        for config in configs:
+            try:
+                checker = cls(**config)
+                results.append(checker.evaluate_migration_alignment())
+            except (AlembicCheckError, ValueError) as ex:
+                logger.error("%s", ex)
+                results.append(1)
+        return results
+
+
+def _configure_logging():
+    """Configures a single stdout handler for the script's diagnostics."""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
 
 
 def main():
     """The main function of the script."""
 
+    _configure_logging()
     parser = argparse.ArgumentParser(description=SCRIPT_DESCRIPTION)
     parser.add_argument("--db_url", type=str, help="Database URL")
     parser.add_argument("--db_type", type=str, help="Database Type")
@@ -301,19 +557,23 @@ def main():
         "--migrations_path", type=str, help="Migrations Path", required=True
     )
     args = parser.parse_args()
-    # Initialize the AlembicMigrationChecker class with the unpacked inputs
-    checker = AlembicMigrationChecker(
-        args.db_url,
-        args.db_type,
-        args.db_host,
-        args.db_port,
-        args.db_user,
-        args.db_password,
-        args.db_name,
-        args.migrations_path,
-    )
-    # Assess the alignment between the database version and the latest migration script.
-    checker.evaluate_migration_alignment()
+    try:
+        # Initialize the AlembicMigrationChecker class with the unpacked inputs
+        checker = AlembicMigrationChecker(
+            args.db_url,
+            args.db_type,
+            args.db_host,
+            args.db_port,
+            args.db_user,
+            args.db_password,
+            args.db_name,
+            args.migrations_path,
+        )
+        # Assess the alignment between the database version and the latest migration script.
+        sys.exit(checker.evaluate_migration_alignment())
+    except AlembicCheckError as ex:
+        logger.error("%s", ex)
+        sys.exit(1)
 
 
 if __name__ == "__main__":